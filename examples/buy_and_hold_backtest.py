@@ -1,3 +1,4 @@
+from collections import deque
 import datetime
 
 import path
@@ -5,7 +6,6 @@ import path
 from qstrader import settings
 from qstrader.strategy.base import AbstractStrategy
 from qstrader.event import SignalEvent, EventType
-from qstrader.compat import queue
 from qstrader.trading_session import TradingSession
 
 
@@ -35,7 +35,7 @@ class BuyAndHoldStrategy(AbstractStrategy):
                     self.ticker, "BOT",
                     suggested_quantity=self.base_quantity
                 )
-                self.events_queue.put(signal)
+                self.events_queue.append(signal)
                 self.invested = True
             self.bars += 1
 
@@ -48,7 +48,7 @@ def run(config, testing, tickers, filename):
     end_date = datetime.datetime(2014, 1, 1)
 
     # Use the Buy and Hold Strategy
-    events_queue = queue.Queue()
+    events_queue = deque()
     strategy = BuyAndHoldStrategy(tickers[0], events_queue)
 
     # Set up the backtest
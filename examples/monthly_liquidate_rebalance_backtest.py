@@ -1,17 +1,19 @@
 from __future__ import annotations
 
-import calendar
+from collections import deque
 import datetime
 
 from munch import Munch
+import numpy as np
 
 from qstrader import settings
-from qstrader.compat import queue
 from qstrader.event import SignalEvent, EventType, BarEvent, TickEvent
 from qstrader.position_sizer.rebalance import LiquidateRebalancePositionSizer
 from qstrader.strategy.base import AbstractStrategy
 from qstrader.trading_session import TradingSession
 
+_BAR_OR_TICK: frozenset[EventType] = frozenset({EventType.BAR, EventType.TICK})
+
 
 class MonthlyLiquidateRebalanceStrategy(AbstractStrategy):
     """
@@ -23,28 +25,67 @@ class MonthlyLiquidateRebalanceStrategy(AbstractStrategy):
     LiquidateRebalancePositionSizer object to work correctly.
     """
 
-    def __init__(self, tickers: list[str], events_queue: queue.Queue):
+    def __init__(
+        self,
+        tickers: list[str],
+        events_queue: deque,
+        start_date: datetime.datetime,
+        end_date: datetime.datetime,
+    ):
         self.tickers: list[str] = tickers
-        self.events_queue: queue.Queue = events_queue
-        self.tickers_invested: dict[str | bool] = self._create_invested_list()
+        self.events_queue: deque = events_queue
+        self._ticker_index: dict[str, int] = {
+            ticker: i for i, ticker in enumerate(self.tickers)
+        }
+        self._invested: bytearray = self._create_invested_flags()
+        # Signals carry no per-bar state, so a single liquidation
+        # and purchase signal per ticker is created up front and
+        # re-sent on every rebalance
+        self._exit_signals: list[SignalEvent] = [
+            SignalEvent(ticker, "EXIT") for ticker in self.tickers
+        ]
+        self._long_signals: list[SignalEvent] = [
+            SignalEvent(ticker, "BOT") for ticker in self.tickers
+        ]
+        self._first_ordinal: int = start_date.toordinal()
+        self._month_end_mask: np.ndarray = self._create_month_end_mask(
+            start_date, end_date
+        )
+        self._last_eom_time: datetime.datetime | None = None
+        self._last_eom_result: bool = False
+
+    def _create_month_end_mask(
+        self, start_date: datetime.datetime, end_date: datetime.datetime
+    ) -> np.ndarray:
+        """
+        Create a boolean array with an entry for every calendar
+        day between the start and end dates of the backtest,
+        which is True where the day is the last of its month.
+        """
+        days = np.arange(
+            np.datetime64(start_date.date(), "D"),
+            np.datetime64(end_date.date(), "D") + 1,
+        )
+        return (days + 1).astype("datetime64[M]") != days.astype("datetime64[M]")
 
     def _end_of_month(self, cur_time: datetime.datetime) -> bool:
         """
         Determine if the current day is at the end of the month.
         """
-        cur_day: int = cur_time.day
-        end_day: int = calendar.monthrange(cur_time.year, cur_time.month)[1]
-        return cur_day == end_day
+        pos: int = cur_time.toordinal() - self._first_ordinal
+        return 0 <= pos < len(self._month_end_mask) and bool(
+            self._month_end_mask[pos]
+        )
 
-    def _create_invested_list(self) -> dict[str, bool]:
+    def _create_invested_flags(self) -> bytearray:
         """
-        Create a dictionary with each ticker as a key, with
-        a boolean value depending upon whether the ticker has
-        been "invested" yet. This is necessary to avoid sending
-        a liquidation signal on the first allocation.
+        Create a flag for each ticker, stored at the ticker's
+        position in the tickers list, depending upon whether
+        the ticker has been "invested" yet. This is necessary
+        to avoid sending a liquidation signal on the first
+        allocation.
         """
-        tickers_invested: dict[str, bool] = {ticker: False for ticker in self.tickers}
-        return tickers_invested
+        return bytearray(len(self.tickers))
 
     def calculate_signals(self, event: BarEvent | TickEvent):
         """
@@ -53,18 +94,26 @@ class MonthlyLiquidateRebalanceStrategy(AbstractStrategy):
         a liquidation signal, as well as a purchase signal,
         for each ticker.
         """
-        if event.type in [EventType.BAR, EventType.TICK] and self._end_of_month(
-            event.time
-        ):
-            ticker: str = event.ticker
-            if self.tickers_invested[ticker]:
-                liquidate_signal: SignalEvent = SignalEvent(ticker, "EXIT")
-                self.events_queue.put(liquidate_signal)
-
-            long_signal: SignalEvent = SignalEvent(ticker, "BOT")
-            self.events_queue.put(long_signal)
-
-            self.tickers_invested[ticker] = True
+        if event.type not in _BAR_OR_TICK:
+            return
+        # No month ends before the 28th, so most bars can be
+        # rejected with a single integer comparison
+        if event.time.day < 28:
+            return
+        # Every ticker shares the bar timestamp, so only
+        # re-evaluate the end of month when the time changes
+        if event.time != self._last_eom_time:
+            self._last_eom_time = event.time
+            self._last_eom_result = self._end_of_month(event.time)
+        if self._last_eom_result:
+            i: int = self._ticker_index[event.ticker]
+            if self._invested[i]:
+                self.events_queue.extend(
+                    (self._exit_signals[i], self._long_signals[i])
+                )
+            else:
+                self.events_queue.append(self._long_signals[i])
+                self._invested[i] = 1
 
 
 def run(config: Munch, testing: bool, tickers: list[str], filename: str):
@@ -75,8 +124,10 @@ def run(config: Munch, testing: bool, tickers: list[str], filename: str):
     end_date = datetime.datetime(2016, 10, 12)
 
     # Use the Monthly Liquidate And Rebalance strategy
-    events_queue = queue.Queue()
-    strategy = MonthlyLiquidateRebalanceStrategy(tickers, events_queue)
+    events_queue = deque()
+    strategy = MonthlyLiquidateRebalanceStrategy(
+        tickers, events_queue, start_date, end_date
+    )
 
     # Use the liquidate and rebalance position sizer
     # with prespecified ticker weights
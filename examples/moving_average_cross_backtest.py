@@ -6,7 +6,6 @@ import numpy as np
 from qstrader import settings
 from qstrader.strategy.base import AbstractStrategy
 from qstrader.event import SignalEvent, EventType
-from qstrader.compat import queue
 from qstrader.trading_session import TradingSession
 
 
@@ -58,7 +57,7 @@ class MovingAverageCrossStrategy(AbstractStrategy):
                         self.ticker, "BOT",
                         suggested_quantity=self.base_quantity
                     )
-                    self.events_queue.put(signal)
+                    self.events_queue.append(signal)
                     self.invested = True
                 elif short_sma < long_sma and self.invested:
                     print("SHORT %s: %s" % (self.ticker, event.time))
@@ -66,7 +65,7 @@ class MovingAverageCrossStrategy(AbstractStrategy):
                         self.ticker, "SLD",
                         suggested_quantity=self.base_quantity
                     )
-                    self.events_queue.put(signal)
+                    self.events_queue.append(signal)
                     self.invested = False
             self.bars += 1
 
@@ -79,7 +78,7 @@ def run(config, testing, tickers, filename):
     end_date = datetime.datetime(2014, 1, 1)
 
     # Use the MAC Strategy
-    events_queue = queue.Queue()
+    events_queue = deque()
     strategy = MovingAverageCrossStrategy(
         tickers[0], events_queue,
         short_window=100,
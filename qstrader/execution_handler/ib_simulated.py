@@ -21,7 +21,7 @@ class IBSimulatedExecutionHandler(AbstractExecutionHandler):
         as well as access to local pricing.
 
         Parameters:
-        events_queue - The Queue of Event objects.
+        events_queue - The deque of Event objects.
         """
         self.events_queue = events_queue
         self.price_handler = price_handler
@@ -77,7 +77,7 @@ class IBSimulatedExecutionHandler(AbstractExecutionHandler):
                 exchange, fill_price,
                 commission
             )
-            self.events_queue.put(fill_event)
+            self.events_queue.append(fill_event)
 
             if self.compliance is not None:
                 self.compliance.record_trade(fill_event)
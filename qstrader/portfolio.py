@@ -1,4 +1,5 @@
 from .position import Position
+from .price_parser import PriceParser
 
 
 class Portfolio(object):
@@ -19,6 +20,8 @@ class Portfolio(object):
         self.positions = {}
         self.closed_positions = []
         self.realised_pnl = 0
+        self._equity_raw_cache = None
+        self._equity_disp_cache = None
 
     def _update_portfolio(self):
         """
@@ -43,6 +46,17 @@ class Portfolio(object):
                 pt.market_value - pt.cost_basis + pt.realised_pnl
             )
 
+    def display_equity(self):
+        """
+        Returns the equity as a display (2dp float) value,
+        reusing the previous conversion while the underlying
+        equity is unchanged.
+        """
+        if self.equity != self._equity_raw_cache:
+            self._equity_raw_cache = self.equity
+            self._equity_disp_cache = PriceParser.display(self.equity)
+        return self._equity_disp_cache
+
     def _add_position(
         self, action, ticker,
         quantity, price, commission
@@ -58,7 +58,7 @@ class PortfolioHandler(object):
         to ultimately be executed by the ExecutionHandler.
         """
         for order_event in order_list:
-            self.events_queue.put(order_event)
+            self.events_queue.append(order_event)
 
     def _convert_fill_to_portfolio_update(self, fill_event):
         """
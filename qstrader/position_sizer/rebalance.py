@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from math import floor
+from fractions import Fraction
 
 from qstrader.event import OrderEvent
 from qstrader.portfolio import Portfolio
@@ -8,6 +8,54 @@ from qstrader.price_parser import PriceParser
 from .base import AbstractPositionSizer
 
 
+# Number of decimal digits of the PriceParser fixed-point scale
+# that lie beyond the cent, used to round raw values to 2dp
+_CENT_DIGITS: int = len(str(PriceParser.PRICE_MULTIPLIER // 100)) - 1
+
+
+def _weighted_qty(num: int, den: int, equity_raw: int, price_raw: int) -> int:
+    """
+    Determine the integer quantity of shares to purchase for
+    a num/den dollar-weight of the equity. Both equity and price
+    are fixed-point integers sharing the PriceParser scale, which
+    cancels out, so the division is carried out exactly after
+    rounding each value to the cent.
+    """
+    equity_raw = round(equity_raw, -_CENT_DIGITS)
+    price_raw = round(price_raw, -_CENT_DIGITS)
+    return (num * equity_raw) // (den * price_raw)
+
+
+# Largest number of tickers for which a specialised
+# if/elif sizing function is generated
+_MAX_SPECIALISED_TICKERS: int = 10
+
+
+def _build_quantity_func(ticker_ratios: dict[str, tuple[int, int]]):
+    """
+    Generate a function of (ticker, equity_raw, price_raw) that
+    returns the weighted quantity for a ticker, with each ticker's
+    integer ratio baked in as constants. Falls back to a lookup
+    in ticker_ratios for larger sets of tickers.
+    """
+    if len(ticker_ratios) > _MAX_SPECIALISED_TICKERS:
+        def _qty(ticker: str, equity_raw: int, price_raw: int) -> int:
+            num, den = ticker_ratios[ticker]
+            return _weighted_qty(num, den, equity_raw, price_raw)
+        return _qty
+
+    lines: list[str] = ["def _qty(ticker, equity_raw, price_raw):"]
+    for i, (ticker, (num, den)) in enumerate(ticker_ratios.items()):
+        lines.append("    %s ticker == %r:" % ("if" if i == 0 else "elif", ticker))
+        lines.append(
+            "        return _weighted_qty(%d, %d, equity_raw, price_raw)" % (num, den)
+        )
+    lines.append("    raise KeyError(ticker)")
+    namespace: dict = {"_weighted_qty": _weighted_qty}
+    exec("\n".join(lines), namespace)
+    return namespace["_qty"]
+
+
 class LiquidateRebalancePositionSizer(AbstractPositionSizer):
     """
     Carries out a periodic full liquidation and rebalance of
@@ -26,6 +74,11 @@ class LiquidateRebalancePositionSizer(AbstractPositionSizer):
 
     def __init__(self, ticker_weights: dict[str, float]) -> None:
         self.ticker_weights: dict[str, float] = ticker_weights
+        self.ticker_ratios: dict[str, tuple[int, int]] = {
+            ticker: Fraction(weight).limit_denominator(10000).as_integer_ratio()
+            for ticker, weight in ticker_weights.items()
+        }
+        self._qty = _build_quantity_func(self.ticker_ratios)
 
     def size_order(self, portfolio: Portfolio, initial_order: OrderEvent) -> OrderEvent:
         """
@@ -46,13 +99,9 @@ class LiquidateRebalancePositionSizer(AbstractPositionSizer):
                 initial_order.action = "BOT"
                 initial_order.quantity = cur_quantity
         else:
-            weight: float = self.ticker_weights[ticker]
             # Determine total portfolio value, work out dollar weight
             # and finally determine integer quantity of shares to purchase
-            price: float = portfolio.price_handler.tickers[ticker]["adj_close"]
-            price = PriceParser.display(price)
-            equity: float | int = PriceParser.display(portfolio.equity)
-            dollar_weight: float = weight * equity
-            weighted_quantity: int = int(floor(dollar_weight / price))
+            price: int = portfolio.price_handler.tickers[ticker]["adj_close"]
+            weighted_quantity: int = self._qty(ticker, portfolio.equity, price)
             initial_order.quantity = weighted_quantity
         return initial_order
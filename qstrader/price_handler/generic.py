@@ -24,7 +24,7 @@ class AbstractGenericHandler(AbstractPriceHandler):
         except (EmptyTickEvent, EmptyBarEvent):
             return
         self._store_event(price_event)
-        self.events_queue.put(price_event)
+        self.events_queue.append(price_event)
 
     @property
     def tickers_lst(self):
@@ -105,4 +105,4 @@ class HistoricCSVTickPriceHandler(AbstractTickPriceHandler):
         ticker = row["Ticker"]
         tev = self._create_event(index, ticker, row)
         self._store_event(tev)
-        self.events_queue.put(tev)
+        self.events_queue.append(tev)
@@ -51,5 +51,5 @@ class IGTickPriceHandler(AbstractTickPriceHandler):
         """
         if self.price_event is not None:
             self._store_event(self.price_event)
-            self.events_queue.put(self.price_event)
+            self.events_queue.append(self.price_event)
             self.price_event = None
@@ -145,4 +145,4 @@ class IQFeedIntradayCsvBarPriceHandler(AbstractBarPriceHandler):
         # Store event
         self._store_event(bev)
         # Send event to queue
-        self.events_queue.put(bev)
+        self.events_queue.append(bev)
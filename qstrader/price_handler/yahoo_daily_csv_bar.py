@@ -175,4 +175,4 @@ class YahooDailyCsvBarPriceHandler(AbstractBarPriceHandler):
         # Store event
         self._store_event(bev)
         # Send event to queue
-        self.events_queue.put(bev)
+        self.events_queue.append(bev)
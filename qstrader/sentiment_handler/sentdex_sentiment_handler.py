@@ -63,6 +63,6 @@ class SentdexSentimentHandler(AbstractSentimentHandler):
                     stream_date, row[1]["Ticker"],
                     row[1]["Sentiment"]
                 )
-                self.events_queue.put(sev)
+                self.events_queue.append(sev)
         else:
             print("No stream_date provided for stream_next sentiment event!")
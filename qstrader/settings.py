@@ -1,10 +1,17 @@
+from __future__ import annotations
+
+import functools
 import os
-import time
 import warnings
 
 import yaml
 from munch import munchify, unmunchify, Munch
 
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader, SafeDumper
+
 ENV_VAR_ROOT: str = "QSTRADER"
 DEFAULT_CONFIG_FILENAME: str = "~/qstrader.yml"
 
@@ -29,12 +36,29 @@ def from_env(key: str, default_value: str = None, root: str = ENV_VAR_ROOT) -> s
         return default_value
 
 
-DEFAULT: Munch = munchify(
-    {
-        "CSV_DATA_DIR": from_env("CSV_DATA_DIR", "~/data"),
-        "OUTPUT_DIR": from_env("OUTPUT_DIR", "~/out"),
-    }
-)
+_DEFAULT: Munch | None = None
+
+
+def _default() -> Munch:
+    """Returns the default configuration, resolving it
+    from the environment on first use only"""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = munchify(
+            {
+                "CSV_DATA_DIR": from_env("CSV_DATA_DIR", "~/data"),
+                "OUTPUT_DIR": from_env("OUTPUT_DIR", "~/out"),
+            }
+        )
+    return _DEFAULT
+
+
+def __getattr__(name: str) -> Munch:
+    # DEFAULT is built lazily (PEP 562) so that importing
+    # settings does not touch the environment
+    if name == "DEFAULT":
+        return _default()
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
 
 TEST: Munch = munchify({"CSV_DATA_DIR": "data", "OUTPUT_DIR": "out"})
@@ -43,15 +67,23 @@ TEST: Munch = munchify({"CSV_DATA_DIR": "data", "OUTPUT_DIR": "out"})
 def from_file(fname: str = DEFAULT_CONFIG_FILENAME, testing: bool = False) -> Munch:
     if testing:
         return TEST
+    return _from_file(os.path.expanduser(fname))
+
+
+@functools.lru_cache(maxsize=8)
+def _from_file(fname: str) -> Munch:
+    """Reads (or creates) the configuration file once per
+    expanded path, so repeated backtests reuse the result"""
     try:
-        with open(os.path.expanduser(fname)) as fd:
-            conf = yaml.safe_load(fd)
+        with open(fname) as fd:
+            conf = yaml.load(fd, Loader=SafeLoader)
         conf: Munch = munchify(conf)
         return conf
     except IOError:
         print("A configuration file named '%s' is missing" % fname)
         s_conf = yaml.dump(
-            unmunchify(DEFAULT),
+            unmunchify(_default()),
+            Dumper=SafeDumper,
             explicit_start=True,
             indent=True,
             default_flow_style=False,
@@ -66,11 +98,10 @@ You still have to create directories with data and put your data in!
 """
             % s_conf
         )
-        time.sleep(3)
         try:
-            with open(os.path.expanduser(fname), "w") as fd:
+            with open(fname, "w") as fd:
                 fd.write(s_conf)
         except IOError:
             print("Can create '%s'" % fname)
     print("Trying anyway with default configuration")
-    return DEFAULT
+    return _default()
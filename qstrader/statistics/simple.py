@@ -1,6 +1,5 @@
 from .base import AbstractStatistics
 from ..compat import pickle
-from ..price_parser import PriceParser
 
 import datetime
 import os
@@ -38,7 +37,7 @@ class SimpleStatistics(AbstractStatistics):
         # Initialize timeseries. Correct timestamp not available yet.
         self.timeseries = ["0000-00-00 00:00:00"]
         # Initialize in order for first-step calculations to be correct.
-        current_equity = PriceParser.display(portfolio_handler.portfolio.equity)
+        current_equity = portfolio_handler.portfolio.display_equity()
         self.hwm = [current_equity]
         self.equity.append(current_equity)
 
@@ -48,7 +47,7 @@ class SimpleStatistics(AbstractStatistics):
         """
         if timestamp != self.timeseries[-1]:
             # Retrieve equity value of Portfolio
-            current_equity = PriceParser.display(portfolio_handler.portfolio.equity)
+            current_equity = portfolio_handler.portfolio.display_equity()
             self.equity.append(current_equity)
             self.timeseries.append(timestamp)
 
@@ -62,9 +62,7 @@ class TearsheetStatistics(AbstractStatistics):
         Update equity curve and benchmark equity curve that must be tracked
         over time.
         """
-        self.equity[timestamp] = PriceParser.display(
-            self.portfolio_handler.portfolio.equity
-        )
+        self.equity[timestamp] = self.portfolio_handler.portfolio.display_equity()
         if self.benchmark is not None:
             self.equity_benchmark[timestamp] = PriceParser.display(
                 self.price_handler.get_last_close(self.benchmark)
@@ -1,7 +1,7 @@
 from __future__ import print_function, annotations
 
+from collections import deque
 from datetime import datetime
-from queue import Queue
 
 from munch import Munch
 
@@ -15,7 +15,6 @@ from qstrader.price_handler.base import AbstractPriceHandler
 from qstrader.sentiment_handler.base import AbstractSentimentHandler
 from qstrader.statistics.base import AbstractStatistics
 from qstrader.strategy.base import AbstractStrategy
-from .compat import queue
 from .compliance.example import ExampleCompliance
 from .event import EventType
 from .execution_handler.ib_simulated import IBSimulatedExecutionHandler
@@ -41,7 +40,7 @@ class TradingSession(object):
         equity: float,
         start_date: datetime,
         end_date: datetime,
-        events_queue: Queue,
+        events_queue: deque,
         session_type: str = "backtest",  # TODO: refactor to enum
         end_session_time: datetime = None,
         price_handler: AbstractPriceHandler = None,
@@ -66,7 +65,7 @@ class TradingSession(object):
         self.equity: float = PriceParser.parse(equity)
         self.start_date: datetime = start_date
         self.end_date: datetime = end_date
-        self.events_queue: Queue = events_queue
+        self.events_queue: deque = events_queue
         self.price_handler: AbstractPriceHandler = price_handler
         self.portfolio_handler: PortfolioHandler = portfolio_handler
         self.compliance: AbstractCompliance = compliance
@@ -128,52 +127,84 @@ class TradingSession(object):
                 self.config, self.portfolio_handler, self.title, self.benchmark
             )
 
-    def _continue_loop_condition(self):
+        self._type_handlers = {
+            EventType.TICK: self._on_bar_tick,
+            EventType.BAR: self._on_bar_tick,
+            EventType.SENTIMENT: self.strategy.calculate_signals,
+            EventType.SIGNAL: self.portfolio_handler.on_signal,
+            EventType.ORDER: self.execution_handler.execute_order,
+            EventType.FILL: self.portfolio_handler.on_fill,
+        }
+        # Handlers keyed directly on the event class, which is
+        # filled in the first time each class is seen
+        self._dispatch = {}
+
+        # Resolve the session type once, rather than on every
+        # iteration of the event loop
         if self.session_type == "backtest":
-            return self.price_handler.continue_backtest
+            price_handler = self.price_handler
+            self._should_continue = lambda: price_handler.continue_backtest
         else:
-            return datetime.now() < self.end_session_time
+            end_session_time = self.end_session_time
+            self._should_continue = lambda: datetime.now() < end_session_time
+
+    def _resolve_handler(self, event):
+        """
+        Looks up the handler for the type of a newly seen
+        event class and caches it against that class, so
+        later events of the same class bypass event.type.
+        """
+        try:
+            handler = self._type_handlers[event.type]
+        except KeyError:
+            raise NotImplementedError("Unsupported event.type '%s'" % event.type)
+        self._dispatch[type(event)] = handler
+        return handler
+
+    def _on_bar_tick(self, event):
+        """
+        Handles a new market event (BarEvent or TickEvent) by
+        streaming any sentiment for the current time, generating
+        signals and updating the portfolio value and statistics.
+        """
+        self.cur_time = event.time
+        # Generate any sentiment events here
+        if self.sentiment_handler is not None:
+            self.sentiment_handler.stream_next(stream_date=self.cur_time)
+        self.strategy.calculate_signals(event)
+        self.portfolio_handler.update_portfolio_value()
+        self.statistics.update(event.time, self.portfolio_handler)
 
     def _run_session(self):
         """
-        Carries out an infinite while loop that polls the
+        Carries out an infinite while loop that drains the
         events queue and directs each event to either the
-        strategy component of the execution handler. The
-        loop continue until the event queue has been
-        emptied.
+        strategy component of the execution handler. Once
+        the queue has been emptied the price handler is
+        asked to stream the next market event.
         """
         if self.session_type == "backtest":
             print("Running Backtest...")
         else:
             print("Running Realtime Session until %s" % self.end_session_time)
 
-        while self._continue_loop_condition():
-            try:
-                event = self.events_queue.get(False)
-            except queue.Empty:
-                self.price_handler.stream_next()
-            else:
+        # Bind the loop's attributes to locals once up front
+        events_queue = self.events_queue
+        popleft = events_queue.popleft
+        dispatch = self._dispatch
+        resolve_handler = self._resolve_handler
+        stream_next = self.price_handler.stream_next
+        should_continue = self._should_continue
+        while should_continue():
+            while events_queue:
+                event = popleft()
                 if event is not None:
-                    if event.type == EventType.TICK or event.type == EventType.BAR:
-                        self.cur_time = event.time
-                        # Generate any sentiment events here
-                        if self.sentiment_handler is not None:
-                            self.sentiment_handler.stream_next(
-                                stream_date=self.cur_time
-                            )
-                        self.strategy.calculate_signals(event)
-                        self.portfolio_handler.update_portfolio_value()
-                        self.statistics.update(event.time, self.portfolio_handler)
-                    elif event.type == EventType.SENTIMENT:
-                        self.strategy.calculate_signals(event)
-                    elif event.type == EventType.SIGNAL:
-                        self.portfolio_handler.on_signal(event)
-                    elif event.type == EventType.ORDER:
-                        self.execution_handler.execute_order(event)
-                    elif event.type == EventType.FILL:
-                        self.portfolio_handler.on_fill(event)
-                    else:
-                        raise NotImplemented("Unsupported event.type '%s'" % event.type)
+                    try:
+                        handler = dispatch[type(event)]
+                    except KeyError:
+                        handler = resolve_handler(event)
+                    handler(event)
+            stream_next()
 
     def start_trading(self, testing=False):
         """
@@ -34,6 +34,18 @@ class TestAmazonGooglePortfolio(unittest.TestCase):
         cash = PriceParser.parse(500000.00)
         self.portfolio = Portfolio(ph, cash)
 
+    def test_display_equity(self):
+        """
+        Check the display equity matches PriceParser.display
+        and follows changes to the underlying equity.
+        """
+        self.assertEqual(self.portfolio.display_equity(), 500000.00)
+        self.portfolio.equity = PriceParser.parse(499999.995)
+        self.assertEqual(
+            self.portfolio.display_equity(),
+            PriceParser.display(self.portfolio.equity)
+        )
+
     def test_calculate_round_trip(self):
         """
         Purchase/sell multiple lots of AMZN and GOOG
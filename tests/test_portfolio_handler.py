@@ -1,3 +1,4 @@
+from collections import deque
 import datetime
 from decimal import Decimal
 import unittest
@@ -5,7 +6,6 @@ import unittest
 from qstrader.event import FillEvent, OrderEvent, SignalEvent
 from qstrader.portfolio_handler import PortfolioHandler
 from qstrader.price_handler.base import AbstractTickPriceHandler
-from qstrader.compat import queue
 
 
 class PriceHandlerMock(AbstractTickPriceHandler):
@@ -63,7 +63,7 @@ class TestSimpleSignalOrderFillCycleForPortfolioHandler(unittest.TestCase):
         $500,000.00 USD in initial cash.
         """
         initial_cash = Decimal("500000.00")
-        events_queue = queue.Queue()
+        events_queue = deque()
         price_handler = PriceHandlerMock()
         position_sizer = PositionSizerMock()
         risk_manager = RiskManagerMock()
@@ -92,7 +92,7 @@ class TestSimpleSignalOrderFillCycleForPortfolioHandler(unittest.TestCase):
         order = OrderEvent("MSFT", "BOT", 100)
         order_list = [order]
         self.portfolio_handler._place_orders_onto_queue(order_list)
-        ret_order = self.portfolio_handler.events_queue.get()
+        ret_order = self.portfolio_handler.events_queue.popleft()
         self.assertEqual(ret_order.ticker, "MSFT")
         self.assertEqual(ret_order.action, "BOT")
         self.assertEqual(ret_order.quantity, 100)
@@ -124,7 +124,7 @@ class TestSimpleSignalOrderFillCycleForPortfolioHandler(unittest.TestCase):
         """
         signal_event = SignalEvent("MSFT", "BOT")
         self.portfolio_handler.on_signal(signal_event)
-        ret_order = self.portfolio_handler.events_queue.get()
+        ret_order = self.portfolio_handler.events_queue.popleft()
         self.assertEqual(ret_order.ticker, "MSFT")
         self.assertEqual(ret_order.action, "BOT")
         self.assertEqual(ret_order.quantity, 100)
@@ -1,8 +1,8 @@
+from collections import deque
 import unittest
 
 from qstrader.price_parser import PriceParser
 from qstrader.price_handler.historic_csv_tick import HistoricCSVTickPriceHandler
-from qstrader.compat import queue
 from qstrader import settings
 
 
@@ -21,7 +21,7 @@ class TestPriceHandlerSimpleCase(unittest.TestCase):
         """
         self.config = settings.TEST
         fixtures_path = self.config.CSV_DATA_DIR
-        events_queue = queue.Queue()
+        events_queue = deque()
         init_tickers = ["GOOG", "AMZN", "MSFT"]
         self.price_handler = HistoricCSVTickPriceHandler(
             fixtures_path, events_queue, init_tickers
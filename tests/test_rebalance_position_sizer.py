@@ -44,6 +44,40 @@ class TestLiquidateRebalancePositionSizer(unittest.TestCase):
         self.assertEqual(sized_a.quantity, 60)
         self.assertEqual(sized_b.quantity, 70)
 
+    def test_weights_converted_to_integer_ratios(self):
+        """
+        Ensure ticker weights are held as exact integer fractions
+        so that sizing can be carried out in integer arithmetic.
+        """
+        self.assertEqual(self.position_sizer.ticker_ratios["AAA"], (3, 10))
+        self.assertEqual(self.position_sizer.ticker_ratios["BBB"], (7, 10))
+
+    def test_unknown_ticker_raises(self):
+        """
+        Ensure sizing a ticker without a prespecified weight
+        raises a KeyError.
+        """
+        order_c = SuggestedOrder("CCC", "BOT", 0)
+        with self.assertRaises(KeyError):
+            self.position_sizer.size_order(self.portfolio, order_c)
+
+    def test_will_add_positions_many_tickers(self):
+        """
+        Tests that sizing is unchanged for ticker sets too large
+        to generate a specialised sizing function for.
+        """
+        ticker_weights = {"T%d" % i: 0.01 for i in range(20)}
+        ticker_weights["AAA"] = 0.3
+        ticker_weights["CCC"] = 0.5
+        position_sizer = LiquidateRebalancePositionSizer(ticker_weights)
+        order_a = SuggestedOrder("AAA", "BOT", 0)
+        order_c = SuggestedOrder("CCC", "BOT", 0)
+        sized_a = position_sizer.size_order(self.portfolio, order_a)
+        sized_c = position_sizer.size_order(self.portfolio, order_c)
+
+        self.assertEqual(sized_a.quantity, 60)
+        self.assertEqual(sized_c.quantity, 5000)
+
     def test_will_liquidate_positions(self):
         """
         Ensure positions will be liquidated completely when asked.